@@ -20,10 +20,12 @@ import argparse
 import os
 import shutil
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import psycopg
 from minio import Minio
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
 
 from src.utils.shared_config import get_default_config
@@ -52,107 +54,155 @@ def confirm_cleanup():
     print("✅ Cleanup confirmed. Starting...")
 
 
-def cleanup_postgresql():
-    """Clean up PostgreSQL database tables and schemas"""
-    print("\n📊 Cleaning up PostgreSQL database...")
-    
-    config = get_default_config()
-    
+def connect_postgresql(config):
+    """Open the PostgreSQL connection shared by the cleanup phases"""
     try:
-        # Connect to PostgreSQL
-        conn = psycopg.connect(
+        return psycopg.connect(
             host=config.db_host,
             port=config.db_port,
             dbname=config.db_name,
             user=config.db_user,
             password=config.db_password,
         )
-        
+    except psycopg.Error as e:
+        print(f"❌ Could not connect to PostgreSQL: {e}")
+        return None
+
+
+def connect_minio(config):
+    """Create the MinIO client shared by the cleanup phases"""
+    try:
+        return Minio(
+            f"{config.s3_host}:{config.s3_port}",
+            access_key=config.s3_access_key,
+            secret_key=config.s3_secret_key,
+            secure=config.s3_secure,
+        )
+    except Exception as e:
+        print(f"❌ Could not create MinIO client: {e}")
+        return None
+
+
+def _rollback(conn):
+    """Roll back a failed cleanup without letting a lost connection abort the other phases"""
+    if conn.closed:
+        return
+    try:
+        conn.rollback()
+    except psycopg.Error as e:
+        print(f"  ❌ PostgreSQL rollback failed: {e}")
+
+
+def cleanup_postgresql(conn):
+    """Clean up PostgreSQL database tables and schemas"""
+    print("\n📊 Cleaning up PostgreSQL database...")
+    
+    if conn is None:
+        print("  ❌ PostgreSQL cleanup skipped: no database connection")
+        return
+    
+    try:
         with conn.cursor() as cur:
-            # Drop all tables in public schema
-            print("  • Dropping tables in public schema...")
+            # All DROPs run in one transaction (single commit below); bound lock waits so a
+            # concurrent session can't stall the cleanup, without inheriting a statement timeout
+            cur.execute("SET LOCAL lock_timeout = '5s'")
+            cur.execute("SET LOCAL statement_timeout = 0")
+            
+            # Discover public tables and non-system schemas in a single round trip
             cur.execute("""
-                SELECT table_name 
+                SELECT 'table' AS kind, table_name AS name
                 FROM information_schema.tables 
                 WHERE table_schema = 'public' AND table_type = 'BASE TABLE'
+                UNION ALL
+                SELECT 'schema', schema_name
+                FROM information_schema.schemata 
+                WHERE schema_name NOT IN ('information_schema', 'pg_catalog', 'pg_toast', 'public')
             """)
-            tables = cur.fetchall()
+            tables = []
+            custom_schemas = []
+            for kind, name in cur.fetchall():
+                (tables if kind == "table" else custom_schemas).append(name)
             
-            for (table_name,) in tables:
-                print(f"    - Dropping table: {table_name}")
-                cur.execute(f'DROP TABLE IF EXISTS public."{table_name}" CASCADE')
+            # Drop all tables in a single statement instead of one round trip per table
+            print("  • Dropping tables in public schema...")
+            if tables:
+                for table_name in tables:
+                    print(f"    - Dropping table: {table_name}")
+                cur.execute(
+                    "DROP TABLE IF EXISTS "
+                    + ", ".join(f'public."{table_name}"' for table_name in tables)
+                    + " CASCADE"
+                )
             
-            # Drop dbt schemas if they exist
+            # Drop dbt schemas (if they exist) together with any other non-system schemas
             dbt_schemas = ['public_staging', 'public_marts']
-            for schema in dbt_schemas:
+            schemas = dbt_schemas + [s for s in custom_schemas if s not in dbt_schemas]
+            for schema in schemas:
                 print(f"  • Dropping schema: {schema}")
-                cur.execute(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE')
-            
-            # Drop any other non-system schemas
-            cur.execute("""
-                SELECT schema_name 
-                FROM information_schema.schemata 
-                WHERE schema_name NOT IN ('information_schema', 'pg_catalog', 'pg_toast', 'public')
-            """)
-            custom_schemas = cur.fetchall()
-            
-            for (schema_name,) in custom_schemas:
-                print(f"  • Dropping custom schema: {schema_name}")
-                cur.execute(f'DROP SCHEMA IF EXISTS "{schema_name}" CASCADE')
+            cur.execute(
+                "DROP SCHEMA IF EXISTS "
+                + ", ".join(f'"{schema}"' for schema in schemas)
+                + " CASCADE"
+            )
             
             conn.commit()
             print("  ✅ PostgreSQL cleanup completed")
             
     except psycopg.Error as e:
         print(f"  ❌ PostgreSQL cleanup failed: {e}")
+        _rollback(conn)
     except Exception as e:
         print(f"  ❌ Unexpected error during PostgreSQL cleanup: {e}")
-    finally:
-        if 'conn' in locals():
-            conn.close()
+        _rollback(conn)
+
+
+def _clean_bucket(client, bucket_name):
+    """Remove all objects in a bucket and then the bucket itself"""
+    print(f"  • Cleaning bucket: {bucket_name}")
+    
+    # Remove all objects in the bucket
+    try:
+        # Stream the listing straight into bulk delete (up to 1000 keys per request),
+        # so deletion starts on the first page and the key list is never materialized
+        listed = 0
+        
+        def delete_objects():
+            nonlocal listed
+            for obj in client.list_objects(bucket_name, recursive=True):
+                listed += 1
+                yield DeleteObject(obj.object_name)
+        
+        failed = 0
+        for error in client.remove_objects(bucket_name, delete_objects()):
+            failed += 1
+            print(f"      ◦ Failed to remove {error.name}: {error}")
+        print(f"    - Removed {listed - failed} objects from {bucket_name}")
+        
+        # Remove the bucket itself
+        print(f"    - Removing bucket: {bucket_name}")
+        client.remove_bucket(bucket_name)
+        
+    except S3Error as e:
+        print(f"    ❌ Error cleaning bucket {bucket_name}: {e}")
 
 
-def cleanup_minio():
+def cleanup_minio(client):
     """Clean up MinIO S3 buckets and objects"""
     print("\n🪣 Cleaning up MinIO S3 storage...")
     
-    config = get_default_config()
-    
+    if client is None:
+        print("  ❌ MinIO cleanup skipped: no MinIO client")
+        return
+
     try:
-        # Connect to MinIO
-        client = Minio(
-            f"{config.s3_host}:{config.s3_port}",
-            access_key=config.s3_access_key,
-            secret_key=config.s3_secret_key,
-            secure=config.s3_secure,
-        )
-        
         # List all buckets
         print("  • Finding buckets...")
-        buckets = client.list_buckets()
+        bucket_names = [bucket.name for bucket in client.list_buckets()]
         
-        for bucket in buckets:
-            print(f"  • Cleaning bucket: {bucket.name}")
-            
-            # Remove all objects in the bucket
-            try:
-                objects = client.list_objects(bucket.name, recursive=True)
-                object_names = [obj.object_name for obj in objects]
-                
-                if object_names:
-                    print(f"    - Removing {len(object_names)} objects...")
-                    for obj_name in object_names:
-                        client.remove_object(bucket.name, obj_name)
-                        print(f"      ◦ Removed: {obj_name}")
-                else:
-                    print("    - No objects to remove")
-                
-                # Remove the bucket itself
-                print(f"    - Removing bucket: {bucket.name}")
-                client.remove_bucket(bucket.name)
-                
-            except S3Error as e:
-                print(f"    ❌ Error cleaning bucket {bucket.name}: {e}")
+        # Buckets are independent, so clean them concurrently with a shared client
+        if bucket_names:
+            with ThreadPoolExecutor(max_workers=min(16, len(bucket_names))) as executor:
+                list(executor.map(partial(_clean_bucket, client), bucket_names))
         
         print("  ✅ MinIO cleanup completed")
         
@@ -187,14 +237,18 @@ def cleanup_local_files():
             
             if os.path.isdir(path):
                 # Remove all contents but keep directory structure
-                for item in os.listdir(path):
-                    item_path = os.path.join(path, item)
-                    if os.path.isfile(item_path):
-                        os.remove(item_path)
-                        print(f"    - Removed file: {item}")
-                    elif os.path.isdir(item_path) and item not in ['.gitkeep', '__pycache__']:
-                        shutil.rmtree(item_path)
-                        print(f"    - Removed directory: {item}")
+                # scandir entries carry the file type from readdir, avoiding a stat per check
+                removed_files = 0
+                removed_dirs = 0
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_file() or entry.is_symlink():
+                            os.remove(entry.path)
+                            removed_files += 1
+                        elif entry.is_dir(follow_symlinks=False) and entry.name not in ['.gitkeep', '__pycache__']:
+                            shutil.rmtree(entry.path)
+                            removed_dirs += 1
+                print(f"    - Removed {removed_files} files and {removed_dirs} directories")
             else:
                 os.remove(path)
                 print(f"    - Removed file: {path}")
@@ -203,17 +257,25 @@ def cleanup_local_files():
     
     # Clean up any remaining JSON files in project root
     print("  • Cleaning project root...")
-    for json_file in Path(".").glob("*.json"):
-        if json_file.name not in ["package.json", "tsconfig.json"]:  # Preserve common config files
-            json_file.unlink()
-            print(f"    - Removed: {json_file}")
+    keep_files = {"package.json", "tsconfig.json"}  # Preserve common config files
+    with os.scandir(".") as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.name not in keep_files and entry.is_file(follow_symlinks=False):
+                os.unlink(entry.path)
+                print(f"    - Removed: {entry.name}")
     
     # Clean up Python cache
     print("  • Cleaning Python cache...")
-    for pycache in Path(".").rglob("__pycache__"):
-        if pycache.is_dir():
-            shutil.rmtree(pycache)
-            print(f"    - Removed: {pycache}")
+    # Directories that never contain our bytecode and can be large to walk
+    skip_dirs = {".git", "node_modules", ".venv", "venv", "dbt_packages"}
+    removed_caches = 0
+    for root, dirs, _ in os.walk(".", topdown=True):
+        if "__pycache__" in dirs:
+            shutil.rmtree(os.path.join(root, "__pycache__"))
+            removed_caches += 1
+        # Prune in place so os.walk does not descend into removed or skipped trees
+        dirs[:] = [d for d in dirs if d != "__pycache__" and d not in skip_dirs]
+    print(f"    - Removed {removed_caches} __pycache__ directories")
     
     print("  ✅ Local files cleanup completed")
 
@@ -231,8 +293,8 @@ def create_empty_directories():
     for directory in directories:
         os.makedirs(directory, exist_ok=True)
         gitkeep_path = os.path.join(directory, ".gitkeep")
-        with open(gitkeep_path, "w") as f:
-            f.write("")  # Empty .gitkeep file
+        # Touch an empty .gitkeep file without setting up a text I/O wrapper
+        os.close(os.open(gitkeep_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
         print(f"  • Created: {directory}/.gitkeep")
     
     print("  ✅ Directory structure recreated")
@@ -255,9 +317,18 @@ def main():
     
     print("\n🚀 Starting complete cleanup process...")
     
+    # Connect once and share the connection/client across cleanup phases
+    config = get_default_config()
+    conn = connect_postgresql(config)
+    client = connect_minio(config)
+    
     # Run all cleanup operations
-    cleanup_postgresql()
-    cleanup_minio()
+    try:
+        cleanup_postgresql(conn)
+        cleanup_minio(client)
+    finally:
+        if conn is not None:
+            conn.close()
     cleanup_local_files()
     create_empty_directories()
     
@@ -266,8 +337,6 @@ def main():
     print("=" * 60)
     print("You can now start fresh by running:")
     print("  python main_orchestrated.py")
-    print("  # or")
-    print("  python main.py")
     print("=" * 60)
 
 
@@ -8,13 +8,11 @@ from src.utils.pipeline_logger import get_pipeline_logger
 from src.utils.shared_config import get_default_config
 
 
-@task
 def setup_load_config() -> Config:
     """Setup configuration for load pipeline"""
     return get_default_config()
 
 
-@task
 def setup_load_logger(config: Config):
     """Setup logger for load pipeline"""
     return get_pipeline_logger("load_pipeline", config)
@@ -24,7 +22,10 @@ def setup_load_logger(config: Config):
 def load_data_to_database(unique_data: List[Dict[Any, Any]], config: Config, logger) -> None:
     """Load processed data into the database"""
     loader = Loader(config, logger)
-    loader.load_data(unique_data)
+    try:
+        loader.load_data(unique_data)
+    finally:
+        loader.close()
     logger.info(f"Successfully loaded {len(unique_data)} items into database")
 
 
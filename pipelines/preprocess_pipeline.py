@@ -1,7 +1,9 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
+import polars as pl
 from prefect import flow, task
 from src.preprocess.transformer import DataTransformer
+from src.utils.config import Config
 from src.utils.data_processing import (
     deduplicate_data_items,
     normalize_data_items,
@@ -11,20 +13,19 @@ from src.utils.pipeline_logger import get_pipeline_logger
 from src.utils.shared_config import get_default_config
 
 
-@task
-def setup_preprocess_logger():
+def setup_preprocess_logger(config: Config):
     """Setup logger for preprocess pipeline"""
-    config = get_default_config()
     return get_pipeline_logger("preprocess_pipeline", config)
 
 
 @task
-def transform_data(raw_data: List[Dict[Any, Any]], logger) -> List[Dict[Any, Any]]:
+def transform_data(raw_data: List[Dict[Any, Any]], logger) -> Union[List[Dict[Any, Any]], pl.DataFrame]:
     """Transform and clean raw data using the DataTransformer"""
     transformer = DataTransformer()
 
     try:
-        transformed_data = transformer.transform_crossref_data(raw_data)
+        # Kept as a DataFrame through normalize/deduplicate/save; records are built once at the end
+        transformed_data = transformer.transform_crossref_data(raw_data, as_frame=True)
 
         # Log transformation summary
         summary = transformer.get_transformation_summary(raw_data, transformed_data)
@@ -39,19 +40,23 @@ def transform_data(raw_data: List[Dict[Any, Any]], logger) -> List[Dict[Any, Any
 
 
 @task
-def normalize_data(raw_data: List[Dict[Any, Any]], logger) -> List[Dict[Any, Any]]:
+def normalize_data(
+    raw_data: Union[List[Dict[Any, Any]], pl.DataFrame], logger
+) -> Union[List[Dict[Any, Any]], pl.DataFrame]:
     """Normalize raw data using shared processing utility"""
     return normalize_data_items(raw_data, logger)
 
 
 @task
-def deduplicate_data(normalized_data: List[Dict[Any, Any]], logger) -> List[Dict[Any, Any]]:
+def deduplicate_data(
+    normalized_data: Union[List[Dict[Any, Any]], pl.DataFrame], logger
+) -> Union[List[Dict[Any, Any]], pl.DataFrame]:
     """Remove duplicates from normalized data using shared processing utility"""
     return deduplicate_data_items(normalized_data, logger)
 
 
 @task
-def save_processed_data(unique_data: List[Dict[Any, Any]], logger) -> str:
+def save_processed_data(unique_data: Union[List[Dict[Any, Any]], pl.DataFrame], logger) -> str:
     """Save processed data to JSON file using shared processing utility"""
     return save_processed_data_to_file(unique_data, logger)
 
@@ -61,7 +66,8 @@ def run_preprocess_pipeline(raw_data: List[Dict[Any, Any]]) -> List[Dict[Any, An
     """
     Main preprocess pipeline flow that transforms, normalizes and deduplicates data
     """
-    logger = setup_preprocess_logger()
+    config = get_default_config()
+    logger = setup_preprocess_logger(config)
 
     # Step 1: Transform and clean raw data using Polars
     transformed_data = transform_data(raw_data, logger)
@@ -75,4 +81,7 @@ def run_preprocess_pipeline(raw_data: List[Dict[Any, Any]]) -> List[Dict[Any, An
     # Step 4: Save processed data
     save_processed_data(unique_data, logger)
 
+    # The load pipeline consumes records, so dictionaries are only materialized here
+    if isinstance(unique_data, pl.DataFrame):
+        unique_data = unique_data.to_dicts()
     return unique_data
@@ -1,11 +1,16 @@
-import glob
-import json
+import asyncio
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from logging import Logger
+from urllib.parse import quote
 
-import requests
-from requests.exceptions import HTTPError
+import aiohttp
+import ijson
+import orjson
+import pyarrow as pa
+import pyarrow.json as pa_json
 from tqdm import tqdm
 
 from src.utils.config import Config
@@ -21,6 +26,19 @@ class Extractor:
         headers (Dict[str, str]): Headers for the API request.
     """
 
+    # Pages buffered between the fetch loop and the writer
+    QUEUE_SIZE = 4
+    # Raw files written by fetch_and_save_data, plus legacy one-page-per-file JSON dumps
+    JSONL_SUFFIXES = (".jsonl.zst", ".jsonl")
+    RAW_FILE_SUFFIXES = JSONL_SUFFIXES + (".json",)
+    # Bytes per block handed to Arrow's JSON reader
+    JSON_BLOCK_SIZE = 64 << 20
+    # Attempts per page on transient errors, with exponential backoff starting at RETRY_BACKOFF seconds
+    RETRY_ATTEMPTS = 5
+    RETRY_BACKOFF = 0.5
+    RETRY_MAX_DELAY = 60
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
     def __init__(self, config: Config, logger: Logger):
         self.config = config
         self.headers = {
@@ -29,104 +47,283 @@ class Extractor:
         self.s3_client = S3Client(config, logger)
 
         self.logger = logger
-        self.logger.info("DataLoader initialized with config: %s", config.__dict__)
+        self.logger.info("DataLoader initialized with config: %s", config.to_dict())
         self.logger.info("Headers set for API request: %s", self.headers)
         self.logger.info("DataLoader initialized successfully.")
 
     def fetch_and_save_data(self, max_pages):
         """
-        Fetch data from CrossRef API by looping through multiple pages.
+        Fetch data from CrossRef API using cursor-based deep paging.
+
+        Items from all pages of a run are appended to a single zstd-compressed JSON Lines
+        file as the pages arrive, and the file is uploaded to S3 as one object.
 
         Args:
             max_pages (int): Maximum number of pages to fetch
         """
         self.logger.info("Fetching data from CrossRef API...")
 
-        all_data = []
+        # Create S3 bucket for raw data if it doesn't exist
+        self.s3_client.create_bucket_if_not_exists(self.config.s3_bucket_raw)
+
+        now = datetime.now()
+        filename = now.strftime("%Y%m%d_%H%M%S") + "_data.jsonl.zst"
+        filepath = f"./data/raw/{filename}"
+
+        # Ensure directory exists
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+        page_count, failed_cursor = asyncio.run(self._fetch_and_save_pages(max_pages, filepath))
+
+        self.logger.info(f"Fetched data from {page_count} pages successfully.")
+        if page_count:
+            # Save to S3
+            s3_object_name = f"crossref/raw/{filename}"
+            if self.s3_client.upload_file(self.config.s3_bucket_raw, s3_object_name, filepath):
+                self.logger.info(f"Uploaded {page_count} pages of data to S3: {s3_object_name}")
+            else:
+                self.logger.error("Failed to upload raw data to S3")
+
+        # Abort the pipeline rather than continue with a silently truncated dataset
+        if failed_cursor is not None:
+            raise RuntimeError(f"Failed to fetch page {page_count + 1} (cursor {failed_cursor}) after retries")
+
+    async def _fetch_and_save_pages(self, max_pages, filepath):
+        """
+        Producer/consumer pipeline: pages are fetched one after another by following
+        CrossRef's next-cursor and queued to a writer task through a bounded queue, so
+        writing a page overlaps with fetching the next one.
 
-        for page_offset in tqdm(range(0, max_pages * 200, 200), desc="Fetching pages", unit="page"):
+        Cursor paging is inherently sequential: a page that still fails after
+        _fetch_page's retries ends pagination, since later pages can't be reached without it.
+        If the writer fails, fetching stops and the writer's exception is raised.
+
+        Returns:
+            tuple: Number of pages fetched and saved, and the cursor that could not be
+            fetched (None when pagination completed)
+        """
+        queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        writer = asyncio.create_task(self._save_pages(queue, filepath))
+
+        page_count = 0
+        failed_cursor = None
+        cursor = "*"
+        async with aiohttp.ClientSession(headers=self.headers) as session:
             try:
-                # Add offset parameter for pagination
-                url = f"{self.config.api_endpoint}&offset={page_offset}"
-                self.logger.info(f"Fetching page with offset {page_offset}: {url}")
+                for _ in tqdm(range(max_pages), desc="Fetching pages", unit="page"):
+                    data = await self._fetch_page(session, cursor)
+                    if data is None:
+                        failed_cursor = cursor
+                        break
 
-                response = requests.get(url, headers=self.headers)
-                response.raise_for_status()
-                data = response.json()
+                    # Check if we have items in the response
+                    message = data.get("message")
+                    if not message or "items" not in message:
+                        self.logger.warning(f"No 'message' or 'items' found in response for page {page_count + 1}")
+                        break
 
-                # Check if we have items in the response
-                if "message" in data and "items" in data["message"]:
-                    items = data["message"]["items"]
+                    items = message["items"]
                     if not items:  # No more items, break the loop
                         self.logger.info("No more items found, stopping pagination")
                         break
 
-                    all_data.append(data)
-                    self.logger.info(f"Fetched {len(items)} items from page offset {page_offset}")
-                else:
-                    self.logger.warning(f"No 'message' or 'items' found in response for offset {page_offset}")
-                    break
+                    page_count += 1
+                    self.logger.info(f"Fetched {len(items)} items from page {page_count}")
+                    await self._queue_page(queue, writer, (page_count, items))
 
-            except HTTPError as http_err:
-                self.logger.error(f"HTTP error occurred for offset {page_offset}: {http_err}")
-                break
-            except Exception as err:
-                self.logger.error(f"An error occurred for offset {page_offset}: {err}")
-                break
+                    next_cursor = message.get("next-cursor")
+                    if not next_cursor or next_cursor == cursor:
+                        self.logger.info("No new cursor returned, stopping pagination")
+                        break
+                    cursor = next_cursor
+            finally:
+                # A failed writer has already stopped the loop; its error is raised below
+                if not writer.done():
+                    await self._queue_page(queue, writer, None)
 
-        self.logger.info(f"Fetched data from {len(all_data)} pages successfully.")
+        await writer
+        return page_count, failed_cursor
 
-        # Create S3 bucket for raw data if it doesn't exist
-        self.s3_client.create_bucket_if_not_exists(self.config.s3_bucket_raw)
+    async def _queue_page(self, queue, writer, page):
+        """
+        Put a page (or the None sentinel) on the writer's queue.
 
-        # Save each page's data to separate files (local backup) and S3
-        for i, data in enumerate(all_data):
-            now = datetime.now()
-            filename = now.strftime("%Y%m%d_%H%M%S") + f"_page_{i+1}_data.json"
-            filepath = f"./data/raw/{filename}"
+        If the writer task stops first, its exception is raised here instead of
+        blocking forever on a full queue.
+        """
+        put = asyncio.ensure_future(queue.put(page))
+        await asyncio.wait({put, writer}, return_when=asyncio.FIRST_COMPLETED)
+        if writer.done():
+            put.cancel()
+            writer.result()
 
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    async def _save_pages(self, queue, filepath):
+        """
+        Writer task: append queued pages to the run's JSON Lines file until a None sentinel arrives.
+        """
+        loop = asyncio.get_running_loop()
+        f = None
+        try:
+            while True:
+                page = await queue.get()
+                if page is None:
+                    break
+                if f is None:
+                    f = pa.CompressedOutputStream(filepath, "zstd")
+                await loop.run_in_executor(None, self._save_page, f, *page)
+        finally:
+            if f is not None:
+                f.close()
+                self.logger.info(f"Saved raw data to {filepath}")
 
-            # Save locally
-            with open(filepath, "w") as f:
-                json.dump(data, f, indent=4)
+    def _save_page(self, f, page_number, items):
+        """
+        Append a single page's items to the open JSON Lines file, one item per line.
+        """
+        f.write(b"".join(orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE) for item in items))
+        self.logger.info(f"Saved page {page_number} data")
 
-            self.logger.info(f"Saved page {i+1} data to {filepath}")
+    async def _fetch_page(self, session, cursor):
+        """
+        Fetch a single page, returning the parsed JSON or None on error.
 
-            # Save to S3
-            s3_object_name = f"crossref/raw/{filename}"
-            if self.s3_client.upload_json(self.config.s3_bucket_raw, s3_object_name, data):
-                self.logger.info(f"Uploaded page {i+1} data to S3: {s3_object_name}")
-            else:
-                self.logger.error(f"Failed to upload page {i+1} data to S3")
+        429/5xx responses and connection errors are retried with exponential backoff,
+        honouring the server's Retry-After header when it asks for a longer wait.
+        """
+        # Add cursor parameter for deep paging
+        url = f"{self.config.api_endpoint}&cursor={quote(cursor, safe='')}"
+
+        for attempt in range(1, self.RETRY_ATTEMPTS + 1):
+            retry_after = None
+            try:
+                self.logger.info(f"Fetching page with cursor {cursor}: {url}")
+                async with session.get(url) as response:
+                    if response.status in self.RETRY_STATUSES and attempt < self.RETRY_ATTEMPTS:
+                        retry_after = response.headers.get("Retry-After")
+                        self.logger.warning(f"HTTP {response.status} for cursor {cursor}")
+                    else:
+                        response.raise_for_status()
+                        return orjson.loads(await response.read())
+            except aiohttp.ClientResponseError as http_err:
+                self.logger.error(f"HTTP error occurred for cursor {cursor}: {http_err}")
+                return None
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+                if attempt == self.RETRY_ATTEMPTS:
+                    self.logger.error(f"Connection error occurred for cursor {cursor}: {err}")
+                    return None
+                self.logger.warning(f"Connection error for cursor {cursor}: {err}")
+            except Exception as err:
+                self.logger.error(f"An error occurred for cursor {cursor}: {err}")
+                return None
+
+            delay = self._retry_delay(attempt, retry_after)
+            self.logger.info(f"Retrying cursor {cursor} in {delay:.1f}s (attempt {attempt + 1})")
+            await asyncio.sleep(delay)
+
+        return None
+
+    def _retry_delay(self, attempt, retry_after=None):
+        """
+        Exponential backoff for the given attempt, raised to Retry-After (in seconds) when present.
+        """
+        delay = self.RETRY_BACKOFF * 2 ** (attempt - 1)
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+        return min(delay, self.RETRY_MAX_DELAY)
 
     def extract_raw_data(self):
         """
-        Extract raw data from the json files in ./data/raw directory.
+        Extract raw data from the (compressed) JSON Lines and legacy JSON page files in ./data/raw directory.
+
+        JSON Lines records are parsed by Arrow; see _load_jsonl_items for how they differ from the raw API JSON.
         """
         self.logger.info("Extracting raw data from JSON files...")
 
+        raw_dir = "./data/raw"
+        with os.scandir(raw_dir) as entries:
+            json_files = sorted(
+                entry.path for entry in entries if entry.name.endswith(self.RAW_FILE_SUFFIXES) and entry.is_file()
+            )
+
+        # Read and parse files concurrently; map() keeps the file order
         data = []
-        json_files = glob.glob(os.path.join("./data/raw", "*.json"))
-        for file in tqdm(json_files, desc="Extracting data", unit="file"):
-            with open(file, "r") as f:
-                try:
-                    json_data = json.load(f)
-
-                    # only get json_data.items
-                    if "message" in json_data and "items" in json_data["message"]:
-                        items = json_data.get("message", {}).get("items", [])
-                        for item in items:
-                            if isinstance(item, dict):
-                                data.append(item)
-                            else:
-                                self.logger.warning(f"Item is not a dictionary: {item}")
-                    else:
-                        self.logger.warning(f"No 'message' or 'items' found in file {file}")
-                except json.JSONDecodeError as e:
-                    self.logger.error(f"Error decoding JSON from file {file}: {e}")
-                    continue
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for file_items in tqdm(
+                executor.map(self._load_items, json_files), total=len(json_files), desc="Extracting data", unit="file"
+            ):
+                data.extend(file_items)
 
         self.logger.info("Raw data extraction completed.")
         return data
+
+    def _load_items(self, file):
+        """
+        Load the item dictionaries from a single raw file.
+        """
+        if file.endswith(self.JSONL_SUFFIXES):
+            return self._load_jsonl_items(file)
+
+        # Legacy one-page-per-file dumps
+        with open(file, "rb") as f:
+            try:
+                # Stream only json_data.message.items instead of loading the whole document
+                file_items = []
+                for item in ijson.items(f, "message.items.item", use_float=True):
+                    if isinstance(item, dict):
+                        file_items.append(item)
+                    else:
+                        self.logger.warning(f"Item is not a dictionary: {item}")
+
+                if not file_items:
+                    self.logger.warning(f"No 'message' or 'items' found in file {file}")
+                return file_items
+            except ijson.JSONError as e:
+                self.logger.error(f"Error decoding JSON from file {file}: {e}")
+                return []
+
+    def _load_jsonl_items(self, file):
+        """
+        Load the item dictionaries from a JSON Lines file written by fetch_and_save_data.
+        The file is decompressed (based on its extension) and parsed in bulk by Arrow's native JSON reader.
+
+        Arrow infers one type per field across the whole file, so the records differ from the
+        API's JSON in ways the preprocess steps don't depend on:
+          - fields missing from a record are present with None;
+          - ISO date-time strings (e.g. created/indexed "date-time", license "start") become
+            naive datetime objects, dropping the "Z" suffix;
+          - an integer field becomes float in every record once any record holds a float there.
+        Use _parse_jsonl_lines when the exact API records are needed.
+        """
+        try:
+            table = pa_json.read_json(file, read_options=pa_json.ReadOptions(block_size=self.JSON_BLOCK_SIZE))
+        except pa.ArrowInvalid as e:
+            # Schema inference fails when a field changes type between records
+            self.logger.warning(f"Arrow could not parse {file} ({e}), falling back to line-by-line parsing")
+            return self._parse_jsonl_lines(file)
+
+        file_items = table.to_pylist()
+        if not file_items:
+            self.logger.warning(f"No items found in file {file}")
+        return file_items
+
+    def _parse_jsonl_lines(self, file):
+        """
+        Parse a (possibly compressed) JSON Lines file one line at a time.
+        """
+        file_items = []
+        with pa.input_stream(file, compression="detect") as stream:
+            for line_number, line in enumerate(io.BufferedReader(stream), start=1):
+                try:
+                    item = orjson.loads(line)
+                except orjson.JSONDecodeError as e:
+                    self.logger.error(f"Error decoding JSON from file {file} line {line_number}: {e}")
+                    continue
+
+                if isinstance(item, dict):
+                    file_items.append(item)
+                else:
+                    self.logger.warning(f"Item is not a dictionary: {item}")
+
+        if not file_items:
+            self.logger.warning(f"No items found in file {file}")
+        return file_items
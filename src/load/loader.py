@@ -11,11 +11,10 @@ class Loader:
     def __init__(self, config: Config, logger: Logger):
         self.config = config
         self.logger = logger
-        self.logger.info("Loader initialized with config: %s", config.__dict__)
+        self.logger.info("Loader initialized with config: %s", config.to_dict())
         self.logger.info("Loader initialized successfully.")
         self.engine = None
-        self.connection = None
-        self.cursor = None
+        self.pool = None
         self.table_name = "crossref_data"
         self.create_table_query = f"""
         CREATE TABLE IF NOT EXISTS {self.table_name} (
@@ -30,10 +29,28 @@ class Loader:
             reference_count INTEGER
         );
         """
+        self.columns = (
+            "title, authors, published_date, doi, journal, publisher, is_referenced_by_count, reference_count"
+        )
+        # Rows are COPYed into a transaction-scoped staging table, then merged with
+        # ON CONFLICT so duplicate DOIs are still skipped
+        self.staging_table_name = f"{self.table_name}_staging"
+        self.create_staging_table_query = f"""
+        CREATE TEMP TABLE {self.staging_table_name} (
+            title TEXT,
+            authors TEXT[],
+            published_date DATE,
+            doi TEXT,
+            journal TEXT,
+            publisher TEXT,
+            is_referenced_by_count INTEGER,
+            reference_count INTEGER
+        ) ON COMMIT DROP;
+        """
+        self.copy_query = f"COPY {self.staging_table_name} ({self.columns}) FROM STDIN"
         self.insert_query = f"""
-        INSERT INTO {self.table_name} (title, authors, published_date, doi, journal,
-        publisher, is_referenced_by_count, reference_count)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        INSERT INTO {self.table_name} ({self.columns})
+        SELECT {self.columns} FROM {self.staging_table_name}
         ON CONFLICT (doi) DO NOTHING;
         """
         self.logger.info("Loader initialized with table name: %s", self.table_name)
@@ -43,65 +60,74 @@ class Loader:
 
     def connect_to_db(self):
         """
-        Connect to the PostgreSQL database.
+        Open a pool of connections to the PostgreSQL database.
+        Operations borrow a connection from the pool and return it when done.
+
+        Raises:
+            Exception: If the database can't be reached, so callers fail fast instead
+            of waiting out the pool timeout again on every operation.
         """
         try:
-            import psycopg
+            from psycopg_pool import ConnectionPool
 
             # Create a connection string
             conn_string = (
                 f"postgresql://{self.config.db_user}:{self.config.db_password}"
                 f"@{self.config.db_host}:{self.config.db_port}/{self.config.db_name}"
             )
-            self.connection = psycopg.connect(conn_string)
-            self.cursor = self.connection.cursor()
+            self.pool = ConnectionPool(conn_string, min_size=2, max_size=16, open=True)
+            self.pool.wait()
             self.logger.info("Connected to the database successfully.")
         except Exception as e:
             self.logger.error(f"Error connecting to the database: {e}")
+            if self.pool is not None:
+                self.pool.close()
+                self.pool = None
+            raise
 
     def create_table(self):
         """
         Create the table in the database if it doesn't exist.
         """
         try:
-            self.cursor.execute(self.create_table_query)
-            self.connection.commit()
+            # The pooled connection commits on success and rolls back on error
+            with self.pool.connection() as connection:
+                connection.execute(self.create_table_query)
             self.logger.info("Table created successfully.")
         except Exception as e:
             self.logger.error(f"Error creating table: {e}")
-            self.connection.rollback()
-        finally:
-            self.cursor.close()
-            self.connection.close()
-            self.logger.info("Database connection closed.")
-            self.logger.info("Table creation query executed successfully.")
 
     def load_data(self, data):
         """
         Load normalized data into the database.
         """
         try:
-            self.connect_to_db()
-            for record in data:
-                self.cursor.execute(
-                    self.insert_query,
-                    (
-                        record["title"],
-                        record["authors"].split(", "),
-                        record["published_date"],
-                        record["doi"],
-                        record["journal"],
-                        record["publisher"],
-                        record["is_referenced_by_count"],
-                        record["reference_count"],
-                    ),
-                )
-            self.connection.commit()
+            with self.pool.connection() as connection, connection.cursor() as cursor:
+                # COPY streams all rows in one operation without per-row parse/plan
+                cursor.execute(self.create_staging_table_query)
+                with cursor.copy(self.copy_query) as copy:
+                    for record in data:
+                        copy.write_row(
+                            (
+                                record["title"],
+                                record["authors"].split(", "),
+                                record["published_date"],
+                                record["doi"],
+                                record["journal"],
+                                record["publisher"],
+                                record["is_referenced_by_count"],
+                                record["reference_count"],
+                            )
+                        )
+                cursor.execute(self.insert_query)
             self.logger.info("Data loaded successfully.")
         except Exception as e:
             self.logger.error(f"Error loading data: {e}")
-            self.connection.rollback()
-        finally:
-            self.cursor.close()
-            self.connection.close()
+
+    def close(self):
+        """
+        Close all pooled database connections.
+        """
+        if self.pool is not None:
+            self.pool.close()
             self.logger.info("Database connection closed.")
@@ -1,16 +1,61 @@
+import polars as pl
+
+
 class Deduplicator:
-    def __init__(self):
+    # Seed for the 64-bit key hashes kept in `seen`; stable within a process
+    HASH_SEED = 0
+
+    def __init__(self, key_field="doi"):
+        self.key_field = key_field
+        # 64-bit hashes of the keys seen so far, instead of the full key strings
         self.seen = set()
 
     def deduplicate(self, data):
         """
         Deduplicate the data by doi field.
+
+        Accepts a list of dictionaries or a Polars DataFrame and returns the same type.
+        Records with an empty key are dropped and the first occurrence of each key is kept.
+        """
+        if isinstance(data, pl.DataFrame):
+            return self._deduplicate_frame(data)
+        if not data:
+            return []
+
+        try:
+            df = pl.DataFrame(data, infer_schema_length=None)
+        except Exception:
+            # Fallback to row-by-row deduplication if DataFrame creation fails
+            return self._deduplicate_records(data)
+
+        if self.key_field not in df.columns:
+            return []
+        return self._deduplicate_frame(df).to_dicts()
+
+    def _deduplicate_frame(self, df: pl.DataFrame) -> pl.DataFrame:
+        """
+        Hash-based deduplication in native code over the key column.
+        """
+        key = pl.col(self.key_field)
+        unique_df = (
+            df.filter(key.is_not_null() & (key != ""))
+            .unique(subset=[self.key_field], keep="first", maintain_order=True)
+            .with_columns(key.hash(seed=self.HASH_SEED).alias("_key_hash"))
+        )
+        if self.seen:
+            unique_df = unique_df.filter(~pl.col("_key_hash").is_in(pl.Series(list(self.seen), dtype=pl.UInt64)))
+        self.seen.update(unique_df.get_column("_key_hash").to_list())
+        return unique_df.drop("_key_hash")
+
+    def _deduplicate_records(self, data):
+        """
+        Deduplicate a list of dictionaries in Python.
         """
+        keys = pl.Series([item.get(self.key_field) for item in data], dtype=pl.Utf8)
         unique_data = []
-        for item in data:
-            doi = item.get("doi")
-            if doi and doi not in self.seen:
+        for item, key, key_hash in zip(data, keys, keys.hash(seed=self.HASH_SEED)):
+            if key and key_hash not in self.seen:
                 unique_data.append(item)
-                self.seen.add(doi)
+                self.seen.add(key_hash)
 
         return unique_data
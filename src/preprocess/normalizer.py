@@ -1,7 +1,28 @@
-from datetime import datetime
+from functools import lru_cache
+
+import polars as pl
+
+# Zero-padded two-digit strings for month/day formatting, indexed by value
+_PAD2 = tuple(f"{i:02d}" for i in range(100))
 
 
 class Normalizer:
+    # Transformed data has flattened structure with specific keys
+    _TRANSFORMED_KEYS = frozenset({"doi", "title", "publisher", "journal", "pub_year", "authors", "author_count"})
+    # Fields read by _normalize_transformed_frame; other fields may mix types a frame can't hold
+    _FRAME_KEYS = (
+        "title",
+        "authors",
+        "pub_year",
+        "pub_month",
+        "pub_day",
+        "doi",
+        "journal",
+        "publisher",
+        "is_referenced_by_count",
+        "reference_count",
+    )
+
     def __init__(
         self,
     ):
@@ -14,29 +35,108 @@ class Normalizer:
         else:
             return self._normalize_raw_data(data)
 
+    def normalize_batch(self, data):
+        """
+        Normalize a whole list of records at once.
+
+        Uses Polars column expressions instead of calling normalize() per record.
+        Returns None when the batch mixes transformed and raw records, holds non-dict
+        items, or has field values that can't share a column type, so callers can fall
+        back to record-by-record normalization.
+        """
+        if not data:
+            return None
+
+        transformed = [self._is_transformed_data(item) for item in data]
+        try:
+            if all(transformed):
+                # Columns absent from every record keep their literal defaults in _normalize_transformed_frame
+                keys = [key for key in self._FRAME_KEYS if any(key in item for item in data)]
+                df = pl.from_dicts(data, schema=keys, infer_schema_length=None)
+            elif not any(transformed) and all(isinstance(item, dict) for item in data):
+                df = self._raw_data_frame(data)
+            else:
+                return None
+        except Exception:
+            # Values of one field can't share a column type; normalize record by record instead
+            return None
+
+        return self._normalize_transformed_frame(df).to_dicts()
+
+    def normalize_frame(self, df: pl.DataFrame) -> pl.DataFrame:
+        """
+        Normalize a DataFrame of transformed records, keeping the result columnar.
+        """
+        return self._normalize_transformed_frame(df)
+
+    def _raw_data_frame(self, data):
+        """
+        Build a transformed-shaped frame from raw CrossRef records in a single pass per column.
+        """
+        dates = [self._extract_raw_date_parts(item) for item in data]
+        return pl.DataFrame(
+            {
+                "title": [(item.get("title") or [""])[0] for item in data],
+                "authors": [
+                    ", ".join(author.get("family") or "" for author in item.get("author") or []) for item in data
+                ],
+                "pub_year": [year for year, _, _ in dates],
+                "pub_month": [month for _, month, _ in dates],
+                "pub_day": [day for _, _, day in dates],
+                "doi": [item.get("DOI", "") for item in data],
+                "journal": [(item.get("container-title") or [""])[0] for item in data],
+                "publisher": [item.get("publisher", "") for item in data],
+                "is_referenced_by_count": [item.get("is-referenced-by-count", 0) for item in data],
+                "reference_count": [item.get("reference-count", 0) for item in data],
+            },
+            strict=False,
+        )
+
+    def _normalize_transformed_frame(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Columnar equivalent of _normalize_transformed_data"""
+
+        def column(name, default):
+            return pl.col(name) if name in df.columns else pl.lit(default)
+
+        year = column("pub_year", None).cast(pl.Int64)
+        month = column("pub_month", None).cast(pl.Int64)
+        day = column("pub_day", None).cast(pl.Int64)
+
+        # Same rules as the per-record path: missing month -> 01-01, missing day -> 01
+        month_str = month.cast(pl.Utf8).str.zfill(2).fill_null("01")
+        day_str = (
+            pl.when(month.is_not_null() & day.is_not_null())
+            .then(day.cast(pl.Utf8).str.zfill(2))
+            .otherwise(pl.lit("01"))
+        )
+        published_date = (
+            pl.when(year.is_not_null())
+            .then(pl.concat_str([year.cast(pl.Utf8).str.zfill(4), month_str, day_str], separator="-"))
+            .otherwise(pl.lit(None, dtype=pl.Utf8))
+        )
+
+        return df.select(
+            [
+                column("title", "").alias("title"),
+                column("authors", "").alias("authors"),  # Already formatted by transformer
+                published_date.alias("published_date"),
+                column("doi", "").alias("doi"),
+                column("journal", "").alias("journal"),
+                column("publisher", "").alias("publisher"),
+                column("is_referenced_by_count", 0).alias("is_referenced_by_count"),
+                column("reference_count", 0).alias("reference_count"),
+            ]
+        )
+
     def _is_transformed_data(self, data):
         """Check if data is already transformed by DataTransformer"""
-        # Transformed data has flattened structure with specific keys
-        transformed_keys = {"doi", "title", "publisher", "journal", "pub_year", "authors", "author_count"}
-        return isinstance(data, dict) and transformed_keys.issubset(set(data.keys()))
+        # dict_keys supports set comparison directly, so no per-call set is built
+        return isinstance(data, dict) and self._TRANSFORMED_KEYS <= data.keys()
 
     def _normalize_transformed_data(self, data):
         """Normalize already transformed data - mainly format conversion"""
         # Simply concatenate date parts as they are, no processing
-        year = data.get("pub_year")
-        month = data.get("pub_month")
-        day = data.get("pub_day")
-
-        # Create date string from available parts
-        if year is not None:
-            if month is not None and day is not None:
-                published_date = f"{year:04d}-{month:02d}-{day:02d}"
-            elif month is not None:
-                published_date = f"{year:04d}-{month:02d}-01"
-            else:
-                published_date = f"{year:04d}-01-01"
-        else:
-            published_date = None
+        published_date = self._format_date(data.get("pub_year"), data.get("pub_month"), data.get("pub_day"))
 
         return {
             "title": data.get("title", ""),
@@ -51,29 +151,53 @@ class Normalizer:
 
     def _normalize_raw_data(self, data):
         """Normalize raw CrossRef data (legacy support)"""
-        normalized_data = {
-            "title": data.get("title", [""])[0],
-            "authors": [author.get("family", "") for author in data.get("author", [])],
+        # Build the record in one dict literal; authors are joined straight from a generator
+        # instead of materializing a list and patching the dict afterwards
+        return {
+            "title": (data.get("title") or [""])[0],
+            "authors": ", ".join(author.get("family") or "" for author in data.get("author") or ()),
             "published_date": self._extract_raw_date(data),
             "doi": data.get("DOI", ""),
-            "journal": data.get("container-title", [""])[0],
+            "journal": (data.get("container-title") or [""])[0],
             "publisher": data.get("publisher", ""),
             "is_referenced_by_count": data.get("is-referenced-by-count", 0),
             "reference_count": data.get("reference-count", 0),
         }
 
-        # Merge authors into a single string
-        normalized_data["authors"] = self.__merge_list(normalized_data["authors"], separator=", ")
-
-        return normalized_data
-
     def _extract_raw_date(self, data):
         """
         Extract and format publication date - just concatenate date parts exactly as they are.
         """
+        return self._format_date(*self._extract_raw_date_parts(data))
+
+    @staticmethod
+    @lru_cache(maxsize=131072)
+    def _format_date(year, month, day):
+        """
+        Format date parts as YYYY-MM-DD, defaulting a missing month or day to 01.
+        Cached because the same (year, month, day) recurs across many records.
+        """
+        if year is None:
+            return None
+
+        year_str = str(year) if year >= 1000 else f"{year:04d}"
+        if month is None:
+            return f"{year_str}-01-01"
+
+        month_str = _PAD2[month] if 0 <= month < 100 else f"{month:02d}"
+        if day is None:
+            return f"{year_str}-{month_str}-01"
+
+        day_str = _PAD2[day] if 0 <= day < 100 else f"{day:02d}"
+        return f"{year_str}-{month_str}-{day_str}"
+
+    def _extract_raw_date_parts(self, data):
+        """
+        Return (year, month, day) from the first date field that has a year.
+        """
         # Try common date fields
         date_fields = ["issued", "published", "published-print"]
-        
+
         for field in date_fields:
             date_data = data.get(field, {})
             if isinstance(date_data, dict) and "date-parts" in date_data:
@@ -83,24 +207,8 @@ class Normalizer:
                     year = parts[0] if len(parts) > 0 else None
                     month = parts[1] if len(parts) > 1 else None
                     day = parts[2] if len(parts) > 2 else None
-                    
+
                     if year is not None:
-                        if month is not None and day is not None:
-                            return f"{year:04d}-{month:02d}-{day:02d}"
-                        elif month is not None:
-                            return f"{year:04d}-{month:02d}-01"
-                        else:
-                            return f"{year:04d}-01-01"
-        
-        return None
-
-    def __merge_list(self, list, separator=", ") -> str:
-        """
-        Merge a list into a string with a separator.
-        """
-        if not list:
-            return ""
-        if isinstance(list, str):
-            return list
+                        return year, month, day
 
-        return separator.join(list)
+        return None, None, None
@@ -1,7 +1,14 @@
 import polars as pl
 import re
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Union
+
+import pyarrow as pa
+
+# DOI URL and "doi:" prefixes stripped during cleanup, matched in one anchored pass;
+# compiled once for the record-by-record fallback
+_DOI_PREFIX_RE = re.compile(r"^(?:(?:https?://)?(?:dx\.)?doi\.org/)?(?:doi:)?")
+_WS_RE = re.compile(r"\s+")
 
 
 class DataTransformer:
@@ -13,37 +20,165 @@ class DataTransformer:
     def __init__(self):
         self.current_year = datetime.now().year
 
-    def transform_crossref_data(self, raw_data: List[Dict[Any, Any]]) -> List[Dict[Any, Any]]:
+    def transform_crossref_data(
+        self, raw_data: List[Dict[Any, Any]], as_frame: bool = False
+    ) -> Union[List[Dict[Any, Any]], pl.DataFrame]:
         """
         Main transformation method for CrossRef data using Polars.
 
         Args:
             raw_data: List of raw CrossRef publication records
+            as_frame: Return the Polars DataFrame instead of converting it to dictionaries
 
         Returns:
-            List of cleaned and transformed records
+            List of cleaned and transformed records (or a DataFrame when as_frame is set;
+            the record-by-record fallback always returns a list)
         """
         if not raw_data:
             return []
 
-        # Convert to Polars DataFrame for efficient processing
-        # First, normalize the nested structure into flat columns
-        flattened_data = [self._flatten_record(record) for record in raw_data]
-
         try:
-            df = pl.DataFrame(flattened_data)
+            lf = self.transform_crossref_data_lazy(raw_data)
         except Exception:
             # Fallback to record-by-record processing if DataFrame creation fails
             return [self._transform_single_record(record) for record in raw_data]
 
-        # Apply transformations
-        df = self._clean_author_data(df)
-        df = self._standardize_identifiers(df)
-        df = self._handle_missing_fields(df)
-        df = self._validate_and_clean_text(df)
+        # Execute once; only convert back to list of dictionaries when asked to
+        df = lf.collect(streaming=True)
+        return df if as_frame else df.to_dicts()
+
+    def transform_crossref_data_lazy(self, raw_data: List[Dict[Any, Any]]) -> pl.LazyFrame:
+        """
+        Build the transformation of non-empty raw CrossRef records as a LazyFrame.
+
+        Raises:
+            Exception: If the records can't be converted to a DataFrame
+        """
+        # Overlapping pages repeat records; drop them before any column is built
+        raw_data = self._drop_duplicate_dois(raw_data)
+
+        # Convert to Polars DataFrame for efficient processing
+        # First, normalize the nested structure into flat columns
+        try:
+            lf = self._flatten_frame(raw_data).lazy()
+        except Exception:
+            # Flatten record by record when the nested fields don't share a schema Polars can infer
+            lf = pl.LazyFrame(self._flatten_columns(raw_data))
+
+        # Build the transformations as one lazy query so Polars can fuse the stages
+        lf = self._downcast_numeric_columns(lf)
+        lf = self._fix_date_issues(lf)
+        lf = self._clean_author_data(lf)
+        lf = self._standardize_identifiers(lf)
+        return self._handle_missing_fields(lf)
+
+    def _drop_duplicate_dois(self, raw_data: List[Dict[Any, Any]]) -> List[Dict[Any, Any]]:
+        """
+        Keep the first record for each DOI, compared the way _standardize_identifiers cleans it.
+        Records without a DOI are all kept.
+        """
+        by_doi = {}
+        for record in raw_data:
+            doi = record.get("DOI") if isinstance(record, dict) else None
+            key = _DOI_PREFIX_RE.sub("", doi.strip().lower(), count=1) if isinstance(doi, str) else ""
+            by_doi.setdefault(key or id(record), record)
+
+        return list(by_doi.values()) if len(by_doi) < len(raw_data) else raw_data
+
+    def _flatten_frame(self, raw_data: List[Dict[Any, Any]]) -> pl.DataFrame:
+        """
+        Vectorized equivalent of _flatten_record: convert the records into nested Arrow
+        columns once and flatten them with Polars expressions.
+        """
+        # Arrow infers the struct type from every record, so sparse fields are kept
+        df = pl.from_arrow(pa.array(raw_data)).struct.unnest()
+        schema = df.schema
+
+        def column(name, default):
+            return pl.col(name).fill_null(default) if name in schema else pl.lit(default)
+
+        def first_text(name):
+            if name not in schema:
+                return pl.lit("")
+            text = pl.col(name).list.first() if isinstance(schema[name], pl.List) else pl.col(name)
+            return text.cast(pl.Utf8).str.strip_chars().fill_null("")
+
+        # Publication date parts from the first field with non-empty date-parts
+        date_parts = [
+            pl.col(field).struct.field("date-parts").list.first().cast(pl.List(pl.Int64))
+            for field in ["issued", "published", "published-print", "published-online"]
+            if isinstance(schema.get(field), pl.Struct) and "date-parts" in schema[field].to_schema()
+        ]
+        parts = (
+            pl.coalesce([pl.when(part.list.len() > 0).then(part) for part in date_parts])
+            if date_parts
+            else pl.lit(None, dtype=pl.List(pl.Int64))
+        )
+
+        # Author names as "given family", skipping authors with neither part
+        if "author" in schema:
+            author_fields = schema["author"].inner.to_schema()
+
+            def name_part(field):
+                if field not in author_fields:
+                    return pl.lit("")
+                return pl.element().struct.field(field).fill_null("").str.strip_chars()
+
+            names = pl.col("author").list.eval(
+                pl.concat_str([name_part("given"), name_part("family")], separator=" ").str.strip_chars()
+            )
+            names = names.list.eval(pl.element().filter(pl.element() != ""))
+            authors = names.list.join("; ").fill_null("")
+            author_count = names.list.len().fill_null(0)
+        else:
+            authors = pl.lit("")
+            author_count = pl.lit(0)
+
+        # with_columns broadcasts the literal defaults to the frame's height
+        flattened = df.with_columns(
+            [
+                column("DOI", "").alias("doi"),
+                first_text("title").alias("title"),
+                column("publisher", "").alias("publisher"),
+                first_text("container-title").alias("journal"),
+                column("volume", "").alias("volume"),
+                column("issue", "").alias("issue"),
+                column("page", "").alias("page"),
+                column("reference-count", 0).alias("reference_count"),
+                column("is-referenced-by-count", 0).alias("is_referenced_by_count"),
+                parts.list.get(0, null_on_oob=True).alias("pub_year"),
+                parts.list.get(1, null_on_oob=True).alias("pub_month"),
+                parts.list.get(2, null_on_oob=True).alias("pub_day"),
+                authors.alias("authors"),
+                author_count.cast(pl.Int64).alias("author_count"),
+            ]
+        )
+        return flattened.select(
+            [
+                "doi",
+                "title",
+                "publisher",
+                "journal",
+                "volume",
+                "issue",
+                "page",
+                "reference_count",
+                "is_referenced_by_count",
+                "pub_year",
+                "pub_month",
+                "pub_day",
+                "authors",
+                "author_count",
+            ]
+        )
 
-        # Convert back to list of dictionaries
-        return df.to_dicts()
+    def _flatten_columns(self, raw_data: List[Dict[Any, Any]]) -> Dict[str, List[Any]]:
+        """
+        Flatten records with _flatten_record into one list per column, which Polars
+        ingests directly instead of unpacking every row dict.
+        """
+        flattened = [self._flatten_record(record) for record in raw_data]
+        return {name: [row[name] for row in flattened] for name in flattened[0]}
 
     def _flatten_record(self, record: Dict[Any, Any]) -> Dict[str, Any]:
         """
@@ -83,21 +218,17 @@ class DataTransformer:
         authors = record.get("author", [])
         if authors and isinstance(authors, list):
             author_names = []
-            author_families = []
-            author_givens = []
 
             for author in authors:
                 if isinstance(author, dict):
-                    family = author.get("family", "").strip()
-                    given = author.get("given", "").strip()
+                    # Arrow-read records carry None for name parts missing in that record
+                    family = (author.get("family") or "").strip()
+                    given = (author.get("given") or "").strip()
 
                     if family or given:
-                        full_name = f"{given} {family}".strip()
-                        author_names.append(full_name)
-                        author_families.append(family)
-                        author_givens.append(given)
+                        author_names.append(f"{given} {family}".strip())
 
-            flattened["authors"] = "; ".join(author_names) if author_names else ""
+            flattened["authors"] = "; ".join(author_names)
             flattened["author_count"] = len(author_names)
         else:
             flattened["authors"] = ""
@@ -114,11 +245,44 @@ class DataTransformer:
         return ""
 
 
-    def _clean_author_data(self, df: pl.DataFrame) -> pl.DataFrame:
+    def _downcast_numeric_columns(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """
+        Narrow the integer columns so every later stage moves fewer bytes.
+        Values that don't fit the narrower type (impossible dates, negative counts) become null.
+        """
+        return lf.with_columns(
+            [
+                pl.col("pub_year").cast(pl.Int16, strict=False),
+                pl.col("pub_month").cast(pl.UInt8, strict=False),
+                pl.col("pub_day").cast(pl.UInt8, strict=False),
+                pl.col("reference_count").cast(pl.UInt32, strict=False),
+                pl.col("is_referenced_by_count").cast(pl.UInt32, strict=False),
+                pl.col("author_count").cast(pl.UInt16, strict=False),
+            ]
+        )
+
+    def _fix_date_issues(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """
+        Drop impossible publication dates: future years, months outside 1-12 and days outside 1-31.
+        Month and day are dropped with the year, so each row's checks are evaluated once.
+        """
+        year = pl.col("pub_year")
+        valid_year = year.is_not_null() & (year <= self.current_year)
+        return lf.with_columns(
+            [
+                pl.when(valid_year).then(year).alias("pub_year"),
+                pl.when(valid_year & pl.col("pub_month").is_between(1, 12))
+                .then(pl.col("pub_month"))
+                .alias("pub_month"),
+                pl.when(valid_year & pl.col("pub_day").is_between(1, 31)).then(pl.col("pub_day")).alias("pub_day"),
+            ]
+        )
+
+    def _clean_author_data(self, lf: pl.LazyFrame) -> pl.LazyFrame:
         """
         Clean and standardize author information.
         """
-        return df.with_columns(
+        return lf.with_columns(
             [
                 # Clean author names - remove extra whitespace and normalize
                 pl.col("authors")
@@ -130,68 +294,50 @@ class DataTransformer:
                 pl.when(pl.col("authors") == "")
                 .then(pl.lit(0))
                 .otherwise(pl.col("authors").str.split(";").list.len())
+                .cast(pl.UInt16)
                 .alias("author_count"),
             ]
         )
 
-    def _standardize_identifiers(self, df: pl.DataFrame) -> pl.DataFrame:
+    def _standardize_identifiers(self, lf: pl.LazyFrame) -> pl.LazyFrame:
         """
         Standardize DOI and other identifiers.
         """
-        return df.with_columns(
+        return lf.with_columns(
             [
                 # Clean and standardize DOI format
                 pl.col("doi")
                 .str.strip_chars()
                 .str.to_lowercase()
-                .str.replace_all(r"^(https?://)?(dx\.)?doi\.org/", "")  # Remove URL prefix
-                .str.replace_all(r"^doi:", "")  # Remove doi: prefix
+                .str.replace(_DOI_PREFIX_RE.pattern, "")  # Remove URL and doi: prefixes
                 .alias("doi"),
             ]
         )
 
-    def _handle_missing_fields(self, df: pl.DataFrame) -> pl.DataFrame:
+    def _handle_missing_fields(self, lf: pl.LazyFrame) -> pl.LazyFrame:
         """
-        Handle missing or empty required fields.
+        Clean text fields and handle missing or empty required fields.
         """
-        return df.with_columns(
+
+        def clean_text(name: str, placeholder: str) -> pl.Expr:
+            # Collapse whitespace and strip first, so whitespace-only values count as missing too
+            cleaned = pl.col(name).str.replace_all(r"\s+", " ").str.strip_chars()
+            return pl.when(cleaned.is_null() | (cleaned == "")).then(pl.lit(placeholder)).otherwise(cleaned).alias(name)
+
+        return lf.with_columns(
             [
                 # Fill missing titles with placeholder
-                pl.when(pl.col("title").is_null() | (pl.col("title") == ""))
-                .then(pl.lit("[Title Missing]"))
-                .otherwise(pl.col("title"))
-                .alias("title"),
+                clean_text("title", "[Title Missing]"),
                 # Fill missing journal names
-                pl.when(pl.col("journal").is_null() | (pl.col("journal") == ""))
-                .then(pl.lit("[Journal Missing]"))
-                .otherwise(pl.col("journal"))
-                .alias("journal"),
+                clean_text("journal", "[Journal Missing]"),
                 # Fill missing publisher
-                pl.when(pl.col("publisher").is_null() | (pl.col("publisher") == ""))
-                .then(pl.lit("[Publisher Missing]"))
-                .otherwise(pl.col("publisher"))
-                .alias("publisher"),
+                clean_text("publisher", "[Publisher Missing]"),
                 # Ensure numeric fields have default values
                 pl.col("reference_count").fill_null(0),
                 pl.col("is_referenced_by_count").fill_null(0),
             ]
         )
 
-    def _validate_and_clean_text(self, df: pl.DataFrame) -> pl.DataFrame:
-        """
-        Validate and clean text fields.
-        """
-        return df.with_columns(
-            [
-                # Clean titles - remove extra whitespace and invalid characters
-                pl.col("title").str.replace_all(r"\s+", " ").str.strip_chars().alias("title"),
-                # Clean journal names
-                pl.col("journal").str.replace_all(r"\s+", " ").str.strip_chars().alias("journal"),
-                # Clean publisher names
-                pl.col("publisher").str.replace_all(r"\s+", " ").str.strip_chars().alias("publisher"),
-            ]
-        )
-
     def _transform_single_record(self, record: Dict[Any, Any]) -> Dict[str, Any]:
         """
         Fallback method to transform a single record without Polars.
@@ -202,7 +348,7 @@ class DataTransformer:
         # Clean text fields
         for field in ["title", "journal", "publisher"]:
             if flattened.get(field):
-                flattened[field] = re.sub(r"\s+", " ", str(flattened[field])).strip()
+                flattened[field] = _WS_RE.sub(" ", str(flattened[field])).strip()
 
         # Handle missing fields
         if not flattened.get("title"):
@@ -218,9 +364,9 @@ class DataTransformer:
                 flattened["pub_year"] = None
 
         # Validate month and day
-        if flattened.get("pub_month") and (flattened["pub_month"] < 1 or flattened["pub_month"] > 12):
+        if flattened.get("pub_month") is not None and not 1 <= flattened["pub_month"] <= 12:
             flattened["pub_month"] = None
-        if flattened.get("pub_day") and (flattened["pub_day"] < 1 or flattened["pub_day"] > 31):
+        if flattened.get("pub_day") is not None and not 1 <= flattened["pub_day"] <= 31:
             flattened["pub_day"] = None
 
         # If year is null, set month and day to null too
@@ -231,8 +377,7 @@ class DataTransformer:
         # Clean DOI
         if flattened.get("doi"):
             doi = flattened["doi"].strip().lower()
-            doi = re.sub(r"^(https?://)?(dx\.)?doi\.org/", "", doi)
-            doi = re.sub(r"^doi:", "", doi)
+            doi = _DOI_PREFIX_RE.sub("", doi, count=1)
             flattened["doi"] = doi
 
         return flattened
@@ -1,4 +1,12 @@
-from typing import Dict
+from typing import Any, Dict
+
+
+def _is_positive_int(value) -> bool:
+    return isinstance(value, int) and value > 0
+
+
+def _is_non_empty_str(value) -> bool:
+    return isinstance(value, str) and bool(value.strip())
 
 
 class Config:
@@ -22,6 +30,41 @@ class Config:
         s3_bucket_raw (str): S3 bucket name for raw data.
     """
 
+    # Fixed attribute set: no per-instance __dict__ and faster attribute access
+    __slots__ = (
+        "api_endpoint",
+        "db_host",
+        "db_port",
+        "db_name",
+        "db_user",
+        "db_password",
+        "s3_host",
+        "s3_port",
+        "s3_access_key",
+        "s3_secret_key",
+        "s3_secure",
+        "s3_bucket_raw",
+        "log_file",
+        "log_level",
+    )
+
+    # (attribute, check, error message) rules applied in order by __validate_config
+    _VALIDATION_RULES = (
+        ("api_endpoint", bool, "API_ENDPOINT is required."),
+        ("db_host", bool, "DB_HOST is required."),
+        ("db_name", bool, "DB_NAME is required."),
+        ("db_user", bool, "DB_USER is required."),
+        ("db_password", bool, "DB_PASSWORD is required."),
+        ("db_port", _is_positive_int, "DB_PORT must be a positive integer."),
+        ("s3_host", bool, "S3_HOST is required."),
+        ("s3_port", _is_positive_int, "S3_PORT must be a positive integer."),
+        ("s3_access_key", bool, "S3_ACCESS_KEY is required."),
+        ("s3_secret_key", bool, "S3_SECRET_KEY is required."),
+        ("s3_bucket_raw", bool, "S3_BUCKET_RAW is required."),
+        ("log_file", _is_non_empty_str, "LOG_FILE must be a non-empty string."),
+        ("log_level", _is_non_empty_str, "LOG_LEVEL must be a non-empty string."),
+    )
+
     def __init__(self, config: Dict[str, str]):
         self.api_endpoint = config.get("API_ENDPOINT", "")
 
@@ -49,32 +92,12 @@ class Config:
         Raises:
             ValueError: If any required configuration is missing or invalid.
         """
-        if not self.api_endpoint:
-            raise ValueError("API_ENDPOINT is required.")
-
-        if not self.db_host:
-            raise ValueError("DB_HOST is required.")
-        if not self.db_name:
-            raise ValueError("DB_NAME is required.")
-        if not self.db_user:
-            raise ValueError("DB_USER is required.")
-        if not self.db_password:
-            raise ValueError("DB_PASSWORD is required.")
-        if not isinstance(self.db_port, int) or self.db_port <= 0:
-            raise ValueError("DB_PORT must be a positive integer.")
-
-        if not self.s3_host:
-            raise ValueError("S3_HOST is required.")
-        if not isinstance(self.s3_port, int) or self.s3_port <= 0:
-            raise ValueError("S3_PORT must be a positive integer.")
-        if not self.s3_access_key:
-            raise ValueError("S3_ACCESS_KEY is required.")
-        if not self.s3_secret_key:
-            raise ValueError("S3_SECRET_KEY is required.")
-        if not self.s3_bucket_raw:
-            raise ValueError("S3_BUCKET_RAW is required.")
-
-        if not isinstance(self.log_file, str) or not self.log_file.strip():
-            raise ValueError("LOG_FILE must be a non-empty string.")
-        if not isinstance(self.log_level, str) or not self.log_level.strip():
-            raise ValueError("LOG_LEVEL must be a non-empty string.")
+        for name, check, message in self._VALIDATION_RULES:
+            if not check(getattr(self, name)):
+                raise ValueError(message)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the configuration values as a dictionary (Config has no __dict__).
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
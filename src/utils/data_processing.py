@@ -2,77 +2,118 @@
 Shared data processing utilities to eliminate code duplication between legacy and pipeline code.
 """
 
-import json
-from datetime import datetime
-from typing import Any, Dict, List
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+import orjson
+import polars as pl
 
 from src.preprocess.deduplicator import Deduplicator
 from src.preprocess.normalizer import Normalizer
 
+# Normalizer holds no per-call state, so one instance is shared by every call
+_NORMALIZER = Normalizer()
+
 
-def normalize_data_items(raw_data: List[Dict[Any, Any]], logger) -> List[Dict[Any, Any]]:
+def normalize_data_items(
+    raw_data: Union[List[Dict[Any, Any]], pl.DataFrame], logger
+) -> Union[List[Dict[Any, Any]], pl.DataFrame]:
     """
     Normalize a list of raw data items using the Normalizer.
     This is shared logic extracted from main.py and preprocess_pipeline.py.
 
     Args:
-        raw_data: List of raw data dictionaries to normalize
+        raw_data: List of raw data dictionaries, or a DataFrame of transformed records, to normalize
         logger: Logger instance for error reporting
 
     Returns:
-        List of normalized data items
+        List of normalized data items (a DataFrame when given one)
     """
-    normalizer = Normalizer()
-    normalized_data = []
+    if isinstance(raw_data, pl.DataFrame):
+        normalized_df = _NORMALIZER.normalize_frame(raw_data)
+        logger.info(f"Normalized {len(normalized_df)} items.")
+        return normalized_df
+
+    # Records are normalized column-wise in one pass when the batch is uniform
+    normalized_data = _NORMALIZER.normalize_batch(raw_data)
+    if normalized_data is not None:
+        logger.info(f"Normalized {len(normalized_data)} items.")
+        return normalized_data
 
-    for item in raw_data:
+    # Bind the method once instead of looking it up for every item
+    normalize = _NORMALIZER.normalize
+
+    def try_normalize(item):
         try:
-            normalized_item = normalizer.normalize(item)
-            normalized_data.append(normalized_item)
+            return normalize(item)
         except KeyError as e:
             logger.error(f"KeyError: {e}")
             logger.error("Data format may have changed. Please check the API response.")
+            return None
+
+    normalized_data = [item for item in map(try_normalize, raw_data) if item is not None]
 
     logger.info(f"Normalized {len(normalized_data)} items.")
     return normalized_data
 
 
-def deduplicate_data_items(normalized_data: List[Dict[Any, Any]], logger) -> List[Dict[Any, Any]]:
+def deduplicate_data_items(
+    normalized_data: Union[List[Dict[Any, Any]], pl.DataFrame], logger
+) -> Union[List[Dict[Any, Any]], pl.DataFrame]:
     """
     Remove duplicates from normalized data items.
     This is shared logic extracted from main.py and preprocess_pipeline.py.
 
     Args:
-        normalized_data: List of normalized data dictionaries
+        normalized_data: List of normalized data dictionaries, or a DataFrame of them
         logger: Logger instance for logging
 
     Returns:
-        List of deduplicated data items
+        List of deduplicated data items (a DataFrame when given one)
     """
+    # A fresh Deduplicator per call: its seen-set must not carry keys over from earlier batches
     deduplicator = Deduplicator()
     unique_data = deduplicator.deduplicate(normalized_data)
     logger.info(f"Deduplicated data to {len(unique_data)} items.")
     return unique_data
 
 
-def save_processed_data_to_file(unique_data: List[Dict[Any, Any]], logger) -> str:
+def save_processed_data_to_file(
+    unique_data: Union[List[Dict[Any, Any]], pl.DataFrame], logger, pretty: bool = False
+) -> str:
     """
     Save processed data to a timestamped JSON file.
     This is shared logic extracted from main.py and preprocess_pipeline.py.
 
     Args:
-        unique_data: List of processed data dictionaries to save
+        unique_data: List of processed data dictionaries, or a DataFrame of them, to save
         logger: Logger instance for logging
+        pretty: Indent the output for human inspection (compact by default)
 
     Returns:
         str: Path to the saved file
     """
-    now = datetime.now()
-    filename = now.strftime("%Y%m%d_%H%M%S") + "_data.json"
-    filepath = f"./data/processed/{filename}"
-
-    with open(filepath, "w") as f:
-        json.dump(unique_data, f, indent=4)
+    output_dir = Path("data/processed")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Nanosecond timestamp so two runs within the same second don't overwrite each other
+    filepath = os.fspath(output_dir / f"{time.time_ns()}_data.json")
+
+    if isinstance(unique_data, pl.DataFrame):
+        if not pretty:
+            # Polars serializes the rows straight from its columns, without building dictionaries
+            unique_data.write_json(filepath)
+            logger.info(f"Saved processed data to {filepath}")
+            return filepath
+        unique_data = unique_data.to_dicts()
+
+    option = orjson.OPT_APPEND_NEWLINE
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+
+    with open(filepath, "wb") as f:
+        f.write(orjson.dumps(unique_data, option=option))
 
     logger.info(f"Saved processed data to {filepath}")
     return filepath
@@ -1,5 +1,8 @@
+import atexit
 import logging
-import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
 
 
 def setup_logger(name: str, log_file: str = "app.log", level: int = logging.INFO) -> logging.Logger:
@@ -16,11 +19,14 @@ def setup_logger(name: str, log_file: str = "app.log", level: int = logging.INFO
     """
     # Create a logger
     logger = logging.getLogger(name)
+    # Already configured by an earlier call; adding handlers again would emit every record twice
+    if logger.handlers:
+        return logger
     logger.setLevel(level)
 
     # Create file handler
-    if not os.path.exists(os.path.dirname(log_file)):
-        os.makedirs(os.path.dirname(log_file))
+    # A bare file name has no parent to create ("." already exists)
+    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
     file_handler = logging.FileHandler(log_file)
     file_handler.setLevel(level)
 
@@ -33,8 +39,12 @@ def setup_logger(name: str, log_file: str = "app.log", level: int = logging.INFO
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
 
-    # Add handlers to the logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # The handlers write on a background listener thread; the logger itself only enqueues records
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    # Stopping the listener flushes records still in the queue at interpreter exit
+    atexit.register(listener.stop)
+    logger.addHandler(QueueHandler(log_queue))
 
     return logger
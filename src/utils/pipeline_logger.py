@@ -2,14 +2,19 @@
 Shared logger factory to eliminate logger setup duplication across pipelines.
 """
 
+from functools import lru_cache
+
 from src.utils.config import Config
 from src.utils.logger import setup_logger
 
 
+@lru_cache(maxsize=None)
 def get_pipeline_logger(pipeline_name: str, config: Config):
     """
     Factory function to create a standardized logger for pipeline components.
     This eliminates duplication of similar logger setup code across pipelines.
+    Loggers are memoized per pipeline name and config, so repeated flow runs
+    reuse the configured logger instead of attaching new handlers.
 
     Args:
         pipeline_name (str): Name of the pipeline (e.g., 'extract_pipeline', 'load_pipeline')
@@ -1,13 +1,51 @@
 import io
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Union
 
+import certifi
+import orjson
+import urllib3
 from minio import Minio
 from minio.error import S3Error
 
 
+class _ChunkedReader(io.RawIOBase):
+    """
+    Read-only file object over an iterable of byte chunks, so data can be streamed to
+    put_object as it is produced.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = memoryview(chunk)
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
 class S3Client:
+    # Objects larger than one part are uploaded as multipart with parts sent in parallel
+    MULTIPART_PART_SIZE = 8 * 1024 * 1024
+    MULTIPART_PARALLEL_UPLOADS = 8
+    # Keep-alive connections shared by all uploads; sized for several concurrent multipart uploads
+    HTTP_POOL_MAXSIZE = 32
+    # Concurrent GETs for batch downloads; below the pool size so connections are reused
+    DOWNLOAD_WORKERS = 16
+
     def __init__(self, config, logger):
         self.config = config
         self.logger = logger
@@ -21,12 +59,26 @@ class S3Client:
                 access_key=self.config.s3_access_key,
                 secret_key=self.config.s3_secret_key,
                 secure=self.config.s3_secure,
+                http_client=self._create_http_client(),
             )
             self.logger.info("MinIO S3 client initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize S3 client: {e}")
             raise
 
+    def _create_http_client(self) -> urllib3.PoolManager:
+        """
+        Build the pooled HTTP client used by MinIO, mirroring its defaults with a larger pool
+        so concurrent uploads reuse connections instead of discarding them.
+        """
+        return urllib3.PoolManager(
+            timeout=urllib3.Timeout(connect=300, read=300),
+            maxsize=self.HTTP_POOL_MAXSIZE,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+            retries=urllib3.Retry(total=5, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504]),
+        )
+
     def create_bucket_if_not_exists(self, bucket_name: str) -> bool:
         try:
             if not self.client.bucket_exists(bucket_name):
@@ -39,17 +91,64 @@ class S3Client:
             self.logger.error(f"Failed to create bucket {bucket_name}: {e}")
             return False
 
-    def upload_json(self, bucket_name: str, object_name: str, data: Dict[Any, Any]) -> bool:
+    def upload_json(self, bucket_name: str, object_name: str, data: Union[Dict[Any, Any], List[Any]]) -> bool:
+        if isinstance(data, list):
+            # Serialize lists record by record while uploading, instead of building the whole document first
+            return self.upload_stream(bucket_name, object_name, self._iter_json_array(data))
+
+        # orjson serializes straight to UTF-8 bytes, so there is no str -> bytes copy
+        json_data = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+        return self.upload_bytes(bucket_name, object_name, json_data)
+
+    @staticmethod
+    def _iter_json_array(records: List[Any]) -> Iterable[bytes]:
+        """
+        Yield a JSON array as byte chunks, one record per line.
+        """
+        yield b"["
+        for i, record in enumerate(records):
+            yield (b",\n" if i else b"\n") + orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS, default=str)
+        yield b"\n]" if records else b"]"
+
+    def upload_stream(
+        self, bucket_name: str, object_name: str, chunks: Iterable[bytes], content_type: str = "application/json"
+    ) -> bool:
+        """
+        Upload data of unknown length from an iterable of byte chunks.
+
+        Parts are uploaded one at a time: MinIO queues every part it has read for its
+        parallel uploaders, so sequential parts keep memory bounded by about one
+        MULTIPART_PART_SIZE instead of one part per uploader.
+        """
         try:
-            json_data = json.dumps(data, indent=2, default=str)
-            json_bytes = json_data.encode("utf-8")
+            self.client.put_object(
+                bucket_name=bucket_name,
+                object_name=object_name,
+                data=_ChunkedReader(chunks),
+                length=-1,
+                content_type=content_type,
+                part_size=self.MULTIPART_PART_SIZE,
+                num_parallel_uploads=1,
+            )
+
+            self.logger.info(f"Uploaded {object_name} to bucket {bucket_name}")
+            return True
+        except S3Error as e:
+            self.logger.error(f"Failed to upload {object_name}: {e}")
+            return False
 
+    def upload_bytes(
+        self, bucket_name: str, object_name: str, data: bytes, content_type: str = "application/json"
+    ) -> bool:
+        try:
             self.client.put_object(
                 bucket_name=bucket_name,
                 object_name=object_name,
-                data=io.BytesIO(json_bytes),
-                length=len(json_bytes),
-                content_type="application/json",
+                data=io.BytesIO(data),
+                length=len(data),
+                content_type=content_type,
+                part_size=self.MULTIPART_PART_SIZE,
+                num_parallel_uploads=self.MULTIPART_PARALLEL_UPLOADS,
             )
 
             self.logger.info(f"Uploaded {object_name} to bucket {bucket_name}")
@@ -60,7 +159,13 @@ class S3Client:
 
     def upload_file(self, bucket_name: str, object_name: str, file_path: str) -> bool:
         try:
-            self.client.fput_object(bucket_name=bucket_name, object_name=object_name, file_path=file_path)
+            self.client.fput_object(
+                bucket_name=bucket_name,
+                object_name=object_name,
+                file_path=file_path,
+                part_size=self.MULTIPART_PART_SIZE,
+                num_parallel_uploads=self.MULTIPART_PARALLEL_UPLOADS,
+            )
             self.logger.info(f"Uploaded file {file_path} as {object_name} to bucket {bucket_name}")
             return True
         except S3Error as e:
@@ -70,7 +175,7 @@ class S3Client:
     def download_json(self, bucket_name: str, object_name: str) -> Optional[Dict[Any, Any]]:
         try:
             response = self.client.get_object(bucket_name, object_name)
-            data = json.loads(response.read().decode("utf-8"))
+            data = orjson.loads(response.read())
             self.logger.info(f"Downloaded {object_name} from bucket {bucket_name}")
             return data
         except S3Error as e:
@@ -81,6 +186,17 @@ class S3Client:
                 response.close()
                 response.release_conn()
 
+    def download_json_many(self, bucket_name: str, object_names: List[str]) -> List[Optional[Dict[Any, Any]]]:
+        """
+        Download several JSON objects concurrently, returning them in the order of object_names
+        (None for objects that failed to download).
+        """
+        if not object_names:
+            return []
+        # The MinIO client is thread-safe, so the round trips can overlap
+        with ThreadPoolExecutor(max_workers=min(self.DOWNLOAD_WORKERS, len(object_names))) as executor:
+            return list(executor.map(partial(self.download_json, bucket_name), object_names))
+
     def list_objects(self, bucket_name: str, prefix: str = "") -> list:
         try:
             objects = self.client.list_objects(bucket_name, prefix=prefix, recursive=True)